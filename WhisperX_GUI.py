@@ -6,11 +6,12 @@ os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import threading
-import whisperx
-from whisperx.diarize import DiarizationPipeline
+import time
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from logging.handlers import RotatingFileHandler
 
+import numpy as np
 import torch
 import gc
 
@@ -24,6 +25,33 @@ root_logger = logging.getLogger()
 root_logger.setLevel(logging.INFO)
 root_logger.addHandler(handler)
 
+# Selectable models: label -> (WhisperX architecture, precision).
+# "int8" runs as int8_float16 on CUDA; CTranslate2 has no fast float16 on CPU,
+# so "float16" presets run as int8 there.
+MODEL_PRESETS = {
+	"large-v2 (fp16)": ("large-v2", "float16"),
+	"large-v2 (int8)": ("large-v2", "int8"),
+	"large-v3 (int8)": ("large-v3", "int8"),
+	"large-v3 (fp16)": ("large-v3", "float16"),
+	"turbo (int8)": ("large-v3-turbo", "int8"),
+	"small (int8)": ("small", "int8"),
+	"base (int8)": ("base", "int8"),
+	"tiny (int8)": ("tiny", "int8"),
+}
+DEFAULT_MODEL_PRESET = "large-v2 (fp16)"
+
+# Batch size used on CPU and as the starting point when VRAM cannot be queried
+DEFAULT_BATCH_SIZE = 4
+# Upper bound for the adaptive GPU batch size
+MAX_BATCH_SIZE = 32
+# Approximate VRAM needed per concurrent 30-second window (large-v2)
+VRAM_PER_BATCH_ITEM = 450 * 1024 * 1024
+# Voice activity detection thresholds; silence outside speech regions never
+# reaches the encoder. Raise vad_onset to drop more low-energy audio.
+VAD_OPTIONS = {"vad_onset": 0.500, "vad_offset": 0.363}
+# Cached alignment models are released when free VRAM drops below this
+ALIGN_CACHE_MIN_FREE_VRAM = 1024 * 1024 * 1024
+
 class WhisperTranscriptionApp:
 	"""Main application class for the WhisperX Transcription GUI.
 	
@@ -33,10 +61,11 @@ class WhisperTranscriptionApp:
 	def copy_transcription(self):
 		"""Copy the transcription text to the clipboard.
 		
-		Retrieves the text from the text area and copies it to the system clipboard.
+		Uses the finished transcription when available and falls back to the
+		text area otherwise (e.g. while a preview is shown).
 		Provides visual feedback by temporarily changing the button text.
 		"""
-		text = self.text_area.get("0.0", "end").strip()
+		text = self.transcription.strip() if self.transcription else self.text_area.get("0.0", "end").strip()
 		if text:
 			self.root.clipboard_clear()
 			self.root.clipboard_append(text)
@@ -60,15 +89,25 @@ class WhisperTranscriptionApp:
 		self.root.configure(bg="#181824")
         
 		self.model = None
+		self.loaded_device = None
+		self.loaded_preset = None
+		# Alignment models keyed by (language_code, device)
+		self.align_cache = {}
 		self.device = ctk.StringVar(value="auto")
+		self.model_preset = ctk.StringVar(value=DEFAULT_MODEL_PRESET)
 		self.alignment_enabled = ctk.BooleanVar(value=False)
 		self.diarization_enabled = ctk.BooleanVar(value=False)
 		self.audio_file = None
 		self.transcription = ""
+		# Current phase text and start time for the elapsed-time status
+		self.phase_status = ""
+		self.transcribe_started = 0.0
+		self.elapsed_job = None
         
 		self.setup_ui()
 		# Reload model if device changes
-		self.device.trace_add('write', self.reload_model)
+		self.device_trace = self.device.trace_add('write', self.reload_model)
+		self.model_preset.trace_add('write', self.reload_model)
 		self.model_loading = False
 		self.load_model()
 		# Check for HF token after UI setup
@@ -98,6 +137,11 @@ class WhisperTranscriptionApp:
 			available_devices.append("cuda")
 		self.device_menu = ctk.CTkOptionMenu(device_frame, variable=self.device, values=available_devices, fg_color="#23263a", text_color="#f8fafc")
 		self.device_menu.pack(side="left", padx=(0, 20))
+
+		# Model selection
+		ctk.CTkLabel(device_frame, text="Model:", font=("Segoe UI", 12), text_color="#f8fafc").pack(side="left", padx=(0, 5))
+		self.model_menu = ctk.CTkOptionMenu(device_frame, variable=self.model_preset, values=list(MODEL_PRESETS), fg_color="#23263a", text_color="#f8fafc")
+		self.model_menu.pack(side="left", padx=(0, 20))
 		
 		# Clear Cache Button
 		self.clear_cache_btn = ctk.CTkButton(
@@ -250,58 +294,153 @@ class WhisperTranscriptionApp:
 		Determines the device (CPU/CUDA), loads the model asynchronously,
 		and updates the UI with status and errors.
 		"""
-		def load():
+		def load(orig_device, device, preset):
 			try:
-				device = self.device.get()
-				orig_device = device
-				if device == "auto":
-					device = "cuda" if torch.cuda.is_available() else "cpu"
-				elif device == "cuda" and not torch.cuda.is_available():
-					device = "cpu"
+				# Imported here so the window paints before WhisperX's heavy import chain runs
+				import whisperx
+				if orig_device == "cuda" and device != "cuda":
 					self.root.after(0, lambda: messagebox.showinfo("Device fallback", "CUDA is not available. Falling back to CPU."))
-				# Determine compute type
-				compute_type = "float16" if device == "cuda" else "int8"
+				arch, precision = MODEL_PRESETS[preset]
+				# Determine compute type (int8 weights with float16 activations on GPU)
+				if device == "cuda":
+					compute_type = "float16" if precision == "float16" else "int8_float16"
+				else:
+					compute_type = "int8"
 				
-				self.model = whisperx.load_model("large-v2", device=device, compute_type=compute_type)
-				self.root.after(0, lambda: self.status_label.configure(text=f"Ready to transcribe ({device}, {compute_type})", text_color="#10b981"))
-				self.root.after(0, lambda: self.transcribe_btn.configure(state="normal"))
-				# Stop animated progress bar and set to complete
-				self.root.after(0, lambda: self.progress_bar.stop())
-				self.root.after(0, lambda: self.progress_bar.configure(mode="determinate"))
-				self.root.after(0, lambda: self.progress_bar.set(1.0))
-				logging.info("Model loaded on device: %s, compute_type: %s", device, compute_type)
-				# If fallback occurred, update dropdown
-				if orig_device != device:
-					self.root.after(0, lambda: self.device.set(device))
+				# One CTranslate2 thread per physical core on CPU (WhisperX defaults to 4 threads).
+				# PyTorch's default thread count is the physical core count; os.cpu_count()
+				# would also count SMT siblings and oversubscribe the cores.
+				self.model = whisperx.load_model(arch, device=device, compute_type=compute_type, vad_options=VAD_OPTIONS, threads=torch.get_num_threads())
+				self.loaded_device = device
+				self.loaded_preset = preset
+				if device == "cuda":
+					self.root.after(0, lambda: self.status_label.configure(text="Warming up model...", text_color="#f59e0b"))
+					self.warm_up_model()
+				logging.info("Model %s loaded on device: %s, compute_type: %s", arch, device, compute_type)
+				# Single UI callback; also updates the dropdown if fallback occurred
+				self.root.after(0, lambda: self.show_model_ready(
+					f"Ready to transcribe ({arch}, {device}, {compute_type})",
+					device if orig_device != device else None
+				))
 			except Exception as e:
 				logging.exception("Failed to load model: %s", e)
-				self.root.after(0, lambda err=str(e): self.status_label.configure(text=f"Error loading model: {err}", text_color="#ef4444"))
-				self.root.after(0, lambda err=str(e): messagebox.showerror("Error", f"Failed to load Whisper model:\n{err}"))
-				self.root.after(0, lambda: self.transcribe_btn.configure(state="disabled"))
-				# Stop progress bar on error
-				self.root.after(0, lambda: self.progress_bar.stop())
-				self.root.after(0, lambda: self.progress_bar.configure(mode="determinate"))
-				self.root.after(0, lambda: self.progress_bar.set(0.0))
-			finally:
-				# Ensure flag is cleared even if an unexpected error occurs
-				self.model_loading = False
+				self.root.after(0, lambda err=str(e): self.show_model_error(err))
 
+		# Read the Tk variables here on the UI thread; the worker must not touch them
+		orig_device = self.device.get()
+		device = self.resolve_device()
+		preset = self.model_preset.get()
+		# Cleared on the UI thread by show_model_ready/show_model_error
 		self.model_loading = True
+		self.set_model_controls_state("disabled")
 		self.status_label.configure(text="Loading WhisperX model...", text_color="#f59e0b")
 		self.transcribe_btn.configure(state="disabled")
 		# Start animated progress bar
 		self.progress_bar.configure(mode="indeterminate")
 		self.progress_bar.start()
-		thread = threading.Thread(target=load, daemon=True)
+		thread = threading.Thread(target=load, args=(orig_device, device, preset), daemon=True)
 		thread.start()
 
+	def set_model_controls_state(self, state):
+		"""Enable or disable the device and model dropdowns.
+		
+		They are disabled while a model loads or a transcription runs, so a
+		reload can never start a second load or swap the model under a worker.
+		
+		Args:
+			state: "normal" or "disabled".
+		"""
+		self.device_menu.configure(state=state)
+		self.model_menu.configure(state=state)
+
+	def show_model_ready(self, status, fallback_device=None):
+		"""Update the UI after the model has loaded.
+		
+		Args:
+			status: Text for the status label.
+			fallback_device: Device to show in the dropdown if it differs from the selection.
+		"""
+		self.model_loading = False
+		self.set_model_controls_state("normal")
+		self.status_label.configure(text=status, text_color="#10b981")
+		self.transcribe_btn.configure(state="normal")
+		# Stop animated progress bar and set to complete
+		self.progress_bar.stop()
+		self.progress_bar.configure(mode="determinate")
+		self.progress_bar.set(1.0)
+		if fallback_device:
+			self.set_device_silently(fallback_device)
+
+	def show_model_error(self, error_msg):
+		"""Update the UI after the model failed to load.
+		
+		Args:
+			error_msg: The error message to display.
+		"""
+		self.model_loading = False
+		self.set_model_controls_state("normal")
+		self.status_label.configure(text=f"Error loading model: {error_msg}", text_color="#ef4444")
+		self.transcribe_btn.configure(state="disabled")
+		# Stop progress bar on error
+		self.progress_bar.stop()
+		self.progress_bar.configure(mode="determinate")
+		self.progress_bar.set(0.0)
+		messagebox.showerror("Error", f"Failed to load Whisper model:\n{error_msg}")
+
+	def warm_up_model(self):
+		"""Run the model once on 30 seconds of silence.
+		
+		Pays for CUDA context and kernel initialisation while the loading
+		spinner is still shown, instead of on the first real transcription.
+		Language detection still runs the encoder even though VAD finds no speech.
+		"""
+		import whisperx
+		try:
+			self.model.transcribe(np.zeros(whisperx.audio.N_SAMPLES, dtype=np.float32), batch_size=1)
+		except Exception as e:
+			logging.warning("Model warm-up failed: %s", e)
+
+	def resolve_device(self):
+		"""Resolve the selected device to the one the model will run on.
+		
+		Returns:
+			"cuda" or "cpu"; "auto" and unavailable CUDA resolve to what is present.
+		"""
+		device = self.device.get()
+		if device == "auto" or (device == "cuda" and not torch.cuda.is_available()):
+			return "cuda" if torch.cuda.is_available() else "cpu"
+		return device
+
+	def set_device_silently(self, device):
+		"""Update the device dropdown without triggering a model reload.
+		
+		Args:
+			device: The device the model was actually loaded on.
+		"""
+		self.device.trace_remove('write', self.device_trace)
+		self.device.set(device)
+		self.device_trace = self.device.trace_add('write', self.reload_model)
+
 	def reload_model(self, *_):
-		"""Reload the Whisper model when device selection changes.
+		"""Reload the Whisper model when the device or model selection changes.
 		
-		Resets the model and triggers a new load with the updated device.
+		Resets the model and triggers a new load with the updated settings.
+		Does nothing if the selected model is already loaded on the resolved device.
 		"""
+		device = self.resolve_device()
+		if self.model is not None and device == self.loaded_device and self.model_preset.get() == self.loaded_preset:
+			return
 		self.status_label.configure(text="Reloading model...", text_color="#666666")
 		self.model = None
+		# Alignment models do not depend on the Whisper model, only on the device
+		if device != self.loaded_device:
+			self.align_cache.clear()
+		self.loaded_device = None
+		self.loaded_preset = None
+		# Hand the old device's memory back before loading on the new one
+		gc.collect()
+		if torch.cuda.is_available():
+			torch.cuda.empty_cache()
 		self.load_model()
 		
 	def check_hf_token(self):
@@ -327,6 +466,56 @@ class WhisperTranscriptionApp:
 			)
 			messagebox.showwarning("Hugging Face Token Required", message)
 	
+	def choose_batch_size(self):
+		"""Pick a transcription batch size that fits the free GPU memory.
+		
+		Returns:
+			DEFAULT_BATCH_SIZE on CPU, otherwise as many 30-second windows as
+			the currently free VRAM allows (capped at MAX_BATCH_SIZE).
+		"""
+		if self.loaded_device != "cuda":
+			return DEFAULT_BATCH_SIZE
+		try:
+			# Blocks PyTorch cached during alignment/diarization count as used and
+			# cannot be reused by CTranslate2, so hand them back before measuring
+			if torch.cuda.memory_reserved() > torch.cuda.memory_allocated():
+				torch.cuda.empty_cache()
+			free_mem, _ = torch.cuda.mem_get_info()
+		except RuntimeError:
+			return DEFAULT_BATCH_SIZE
+		return max(1, min(MAX_BATCH_SIZE, free_mem // VRAM_PER_BATCH_ITEM))
+	
+	def get_align_model(self, language_code, device):
+		"""Return the alignment model for a language, loading it on first use.
+		
+		Args:
+			language_code: Language detected by the transcription.
+			device: Device the alignment model should run on.
+			
+		Returns:
+			Tuple of (model, metadata) as returned by whisperx.load_align_model.
+		"""
+		key = (language_code, device)
+		if key not in self.align_cache:
+			import whisperx
+			self.align_cache[key] = whisperx.load_align_model(language_code=language_code, device=device)
+		return self.align_cache[key]
+	
+	def release_align_models_if_low_vram(self, device):
+		"""Drop cached alignment models when the GPU is running low on memory.
+		
+		Args:
+			device: Device the alignment models were loaded on; CPU models are kept.
+		"""
+		if not self.align_cache or device != "cuda":
+			return
+		free_mem, _ = torch.cuda.mem_get_info()
+		if free_mem < ALIGN_CACHE_MIN_FREE_VRAM:
+			logging.info("Low VRAM (%d MB free). Releasing cached alignment models", free_mem // (1024 * 1024))
+			self.align_cache.clear()
+			gc.collect()
+			torch.cuda.empty_cache()
+	
 	def format_timestamp(self, seconds):
 		"""Format timestamp in seconds to MM:SS.mmm format.
 		
@@ -336,8 +525,8 @@ class WhisperTranscriptionApp:
 		Returns:
 			Formatted string in MM:SS.mmm format
 		"""
-		minutes = int(seconds // 60)
-		secs = seconds % 60
+		minutes, secs = divmod(seconds, 60)
+		minutes = int(minutes)
 		return f"{minutes:02d}:{secs:06.3f}"
         
 	def select_file(self):
@@ -360,6 +549,7 @@ class WhisperTranscriptionApp:
 			self.file_label.configure(text=os.path.basename(filename))
 			self.transcribe_btn.configure(state="normal")
 			self.text_area.delete("0.0", "end")
+			self.transcription = ""
 			self.export_btn.configure(state="disabled")
             
 	def transcribe(self):
@@ -375,24 +565,41 @@ class WhisperTranscriptionApp:
 			return
 
 		self.transcribe_btn.configure(state="disabled")
-		self.status_label.configure(text="Transcribing... This may take a while for long files", text_color="#f59e0b")
+		self.set_model_controls_state("disabled")
 		self.text_area.delete("0.0", "end")
-		self.progress_bar.configure(mode="indeterminate")
-		self.progress_bar.start()
+		self.transcription = ""
+		# Determinate bar advanced per phase; avoids the indeterminate animation's redraw timer
+		self.progress_bar.configure(mode="determinate")
+		self.transcribe_started = time.monotonic()
+		self.show_progress("Transcribing... This may take a while for long files", 0.0)
+		# A phase can take minutes; a once-per-second elapsed time shows the app is alive
+		self.elapsed_job = self.root.after(1000, self.tick_elapsed)
+
+		# Snapshot Tk state on the UI thread; the worker must not touch Tk variables
+		device = self.loaded_device
+		align = self.alignment_enabled.get()
+		diarize = self.diarization_enabled.get()
+		# Transcription, then alignment (also required by diarization), then diarization
+		phases = 1 + (align or diarize) + diarize
 
+		# No gradients are needed; inference_mode also skips autograd version tracking
+		@torch.inference_mode()
 		def run_transcription():
 			try:
+				import whisperx
 				# Transcribe using WhisperX
 				# 1. Load audio
 				audio = whisperx.load_audio(self.audio_file)
 				
-				# 2. Transcribe with batching (try default batch size first)
+				# 2. Transcribe with batching (sized to the free VRAM first)
+				batch_size = self.choose_batch_size()
+				logging.info("Transcribing with batch_size=%d", batch_size)
 				try:
-					result = self.model.transcribe(audio, batch_size=4)
+					result = self.model.transcribe(audio, batch_size=batch_size)
 				except RuntimeError as e:
 					if "out of memory" in str(e).lower():
 						logging.warning("OOM detected. Retrying with batch_size=1 and gc.collect()")
-						self.root.after(0, lambda: self.status_label.configure(text="OOM detected. Retrying with lower settings...", text_color="#f59e0b"))
+						self.root.after(0, lambda: self.show_progress("OOM detected. Retrying with lower settings...", 0.0))
 						
 						# Clear memory
 						gc.collect()
@@ -403,22 +610,17 @@ class WhisperTranscriptionApp:
 					else:
 						raise e
 
+				# Show the raw text right away while alignment/diarization run
+				if align or diarize:
+					preview = " ".join(seg["text"].strip() for seg in result.get("segments", []))
+					self.root.after(0, lambda text=preview: self.show_preview(text))
+
 				# 3. Align (if enabled)
-				if self.alignment_enabled.get() or self.diarization_enabled.get():
-					self.root.after(0, lambda: self.status_label.configure(text="Aligning...", text_color="#f59e0b"))
-					
-					# Clear memory before loading alignment model
-					gc.collect()
-					torch.cuda.empty_cache()
+				if align or diarize:
+					self.root.after(0, lambda: self.show_progress("Aligning...", 1 / phases))
 					
-					device = self.device.get()
-					if device == "auto":
-						device = "cuda" if torch.cuda.is_available() else "cpu"
-					elif device == "cuda" and not torch.cuda.is_available():
-						device = "cpu"
-						
 					try:
-						model_a, metadata = whisperx.load_align_model(language_code=result["language"], device=device)
+						model_a, metadata = self.get_align_model(result["language"], device)
 						result = whisperx.align(result["segments"], model_a, metadata, audio, device, return_char_alignments=False)
 					except OSError as e:
 						error_str = str(e).lower()
@@ -435,18 +637,13 @@ class WhisperTranscriptionApp:
 							) from e
 						raise e
 					
-					# Clear memory after alignment
+					# Keep the alignment model cached unless VRAM is running low
 					del model_a
-					gc.collect()
-					torch.cuda.empty_cache()
+					self.release_align_models_if_low_vram(device)
 				
 				# 4. Diarize (if enabled)
-				if self.diarization_enabled.get():
-					self.root.after(0, lambda: self.status_label.configure(text="Identifying speakers...", text_color="#f59e0b"))
-					
-					# Clear memory before loading diarization model
-					gc.collect()
-					torch.cuda.empty_cache()
+				if diarize:
+					self.root.after(0, lambda: self.show_progress("Identifying speakers...", 2 / phases))
 					
 					# Get HF token
 					hf_token = os.environ.get("HF_TOKEN")
@@ -465,6 +662,7 @@ class WhisperTranscriptionApp:
 					
 					try:
 						# Load diarization pipeline
+						from whisperx.diarize import DiarizationPipeline
 						diarize_model = DiarizationPipeline(use_auth_token=hf_token, device=device)
 						
 						# Run diarization
@@ -488,52 +686,47 @@ class WhisperTranscriptionApp:
 						else:
 							raise e
 					
-					# Clear memory after diarization
+					# The pipeline is rebuilt on every run; free its memory now
 					del diarize_model
-					gc.collect()
-					torch.cuda.empty_cache()
+					if device == "cuda":
+						gc.collect()
+						if torch.cuda.memory_reserved() > torch.cuda.memory_allocated():
+							torch.cuda.empty_cache()
+
+				# The decoded audio is not needed past this point; release it
+				# before formatting instead of holding it until the thread exits
+				del audio
 
 				# 5. Combine segments and format output
 				segments = result.get("segments", [])
 				
 				# Format output based on enabled features
-				if self.diarization_enabled.get() and segments:
+				fmt = self.format_timestamp
+				if diarize and segments:
 					# Format with speaker labels and timestamps
 					formatted_segments = []
+					append = formatted_segments.append
 					for seg in segments:
 						speaker = seg.get("speaker", "UNKNOWN")
 						if "start" in seg and "end" in seg:
-							start_time = self.format_timestamp(seg["start"])
-							end_time = self.format_timestamp(seg["end"])
-							formatted_segments.append(f"[{speaker}] [{start_time} - {end_time}] {seg['text'].strip()}")
+							append(f"[{speaker}] [{fmt(seg['start'])} - {fmt(seg['end'])}] {seg['text'].strip()}")
 						else:
-							formatted_segments.append(f"[{speaker}] {seg['text'].strip()}")
+							append(f"[{speaker}] {seg['text'].strip()}")
 					self.transcription = "\n".join(formatted_segments)
-				elif self.alignment_enabled.get() and segments:
+				elif align and segments and "start" in segments[0] and "end" in segments[0]:
 					# Format with timestamps only (no speaker labels)
-					if "start" in segments[0] and "end" in segments[0]:
-						formatted_segments = []
-						for seg in segments:
-							start_time = self.format_timestamp(seg["start"])
-							end_time = self.format_timestamp(seg["end"])
-							formatted_segments.append(f"[{start_time} - {end_time}] {seg['text'].strip()}")
-						self.transcription = "\n".join(formatted_segments)
-					else:
-						# Fallback to plain text if no timestamps
-						self.transcription = " ".join([seg["text"].strip() for seg in segments])
+					self.transcription = "\n".join(
+						f"[{fmt(seg['start'])} - {fmt(seg['end'])}] {seg['text'].strip()}" for seg in segments
+					)
 				else:
-					# Plain text output when alignment and diarization are disabled
-					self.transcription = " ".join([seg["text"].strip() for seg in segments])
+					# Plain text output when alignment and diarization are disabled,
+					# or when aligned segments carry no timestamps
+					self.transcription = " ".join(seg["text"].strip() for seg in segments)
 				
 				self.root.after(0, self.update_transcription_ui)
 			except Exception as e:
 				logging.exception("Transcription error: %s", e)
 				self.root.after(0, lambda err=str(e): self.show_error(err))
-			finally:
-				# Always clean up after transcription
-				gc.collect()
-				if torch.cuda.is_available():
-					torch.cuda.empty_cache()
 
 		thread = threading.Thread(target=run_transcription, daemon=True)
 		thread.start()
@@ -541,16 +734,56 @@ class WhisperTranscriptionApp:
 	def update_transcription_ui(self):
 		"""Update the UI after transcription completes.
 		
-		Inserts the transcription text, updates status, and enables export.
+		Replaces any preview with the final transcription text, updates status,
+		and enables export.
 		"""
+		self.stop_elapsed_timer()
+		self.text_area.delete("0.0", "end")
 		self.text_area.insert("0.0", self.transcription)
 		self.status_label.configure(text="Transcription complete!", text_color="#10b981")
 		self.transcribe_btn.configure(state="normal")
+		self.set_model_controls_state("normal")
 		self.export_btn.configure(state="normal")
 		self.progress_bar.stop()
 		self.progress_bar.configure(mode="determinate")
 		self.progress_bar.set(1.0)
         
+	def show_progress(self, status, fraction):
+		"""Report the current transcription phase.
+		
+		Args:
+			status: Text for the status label.
+			fraction: Share of the phases completed so far (0.0 - 1.0).
+		"""
+		self.phase_status = status
+		self.show_elapsed()
+		self.progress_bar.set(fraction)
+	
+	def show_elapsed(self):
+		"""Show the current phase with the time elapsed since transcription started."""
+		minutes, secs = divmod(int(time.monotonic() - self.transcribe_started), 60)
+		self.status_label.configure(text=f"{self.phase_status} ({minutes}:{secs:02d})", text_color="#f59e0b")
+	
+	def tick_elapsed(self):
+		"""Refresh the elapsed time once per second until the transcription ends."""
+		self.show_elapsed()
+		self.elapsed_job = self.root.after(1000, self.tick_elapsed)
+	
+	def stop_elapsed_timer(self):
+		"""Cancel the pending elapsed-time refresh, if any."""
+		if self.elapsed_job is not None:
+			self.root.after_cancel(self.elapsed_job)
+			self.elapsed_job = None
+        
+	def show_preview(self, text):
+		"""Show the unaligned transcription while post-processing continues.
+		
+		Args:
+			text: Plain transcription text from the first pass.
+		"""
+		self.text_area.delete("0.0", "end")
+		self.text_area.insert("0.0", text)
+        
 	def show_error(self, error_msg):
 		"""Display an error message to the user.
 		
@@ -560,7 +793,9 @@ class WhisperTranscriptionApp:
 			error_msg: The error message to display.
 		"""
 		logging.error("Transcription failed: %s", error_msg)
+		self.stop_elapsed_timer()
 		self.status_label.configure(text="Transcription failed", text_color="#ef4444")
+		self.set_model_controls_state("normal")
 		self.progress_bar.stop()
 		self.progress_bar.configure(mode="determinate")
 		self.progress_bar.set(0.0)
@@ -594,21 +829,40 @@ class WhisperTranscriptionApp:
 		"""Clear the Hugging Face model cache.
 		
 		Deletes the Hugging Face cache directory to resolve corruption issues.
+		The top-level model folders are removed in parallel on a background
+		thread so the UI stays responsive.
 		"""
 		if not messagebox.askyesno("Clear Cache", "This will delete all cached Hugging Face models (including WhisperX models).\nThey will be re-downloaded next time you run a transcription.\n\nAre you sure?"):
 			return
-			
-		try:
-			# Default HF cache path on Windows
-			cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "huggingface", "hub")
-			if os.path.exists(cache_dir):
-				shutil.rmtree(cache_dir)
-				messagebox.showinfo("Success", "Cache cleared successfully.\nPlease restart the application.")
+
+		def remove(path):
+			if os.path.isdir(path) and not os.path.islink(path):
+				shutil.rmtree(path)
 			else:
-				messagebox.showinfo("Info", "Cache directory not found or already empty.")
-		except Exception as e:
-			logging.exception("Failed to clear cache: %s", e)
-			messagebox.showerror("Error", f"Failed to clear cache:\n{e}")
+				os.remove(path)
+
+		def clear():
+			try:
+				# Same location download_models.py uses; honours HF_HOME, HF_HUB_CACHE and XDG_CACHE_HOME
+				from huggingface_hub import constants
+				cache_dir = constants.HF_HUB_CACHE
+				if not os.path.exists(cache_dir):
+					self.root.after(0, lambda: messagebox.showinfo("Info", "Cache directory not found or already empty."))
+					return
+				entries = [os.path.join(cache_dir, entry) for entry in os.listdir(cache_dir)]
+				with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+					list(executor.map(remove, entries))
+				shutil.rmtree(cache_dir)
+				self.root.after(0, lambda: messagebox.showinfo("Success", "Cache cleared successfully.\nPlease restart the application."))
+			except Exception as e:
+				logging.exception("Failed to clear cache: %s", e)
+				self.root.after(0, lambda err=str(e): messagebox.showerror("Error", f"Failed to clear cache:\n{err}"))
+			finally:
+				self.root.after(0, lambda: self.clear_cache_btn.configure(state="normal", text="Clear Cache"))
+
+		self.clear_cache_btn.configure(state="disabled", text="Clearing...")
+		thread = threading.Thread(target=clear, daemon=True)
+		thread.start()
 
 def main():
 	root = ctk.CTk()
@@ -1,50 +1,255 @@
+import importlib.util
 import os
+import sys
 # Suppress HuggingFace symlink warning
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
-# Enable faster downloads with hf_transfer
-os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
+# huggingface_hub reads HF_HUB_OFFLINE once at import time, so --offline has
+# to be applied here rather than after argument parsing in __main__
+if __name__ == "__main__" and "--offline" in sys.argv[1:]:
+    os.environ["HF_HUB_OFFLINE"] = "1"
+# Prefer hf_xet (pip install hf_xet): huggingface_hub uses it automatically and
+# its chunk deduplication skips bytes already in the cache on model updates.
+# Fall back to hf_transfer for faster downloads when it is not installed.
+# hf_transfer does not support HTTP proxies, so keep the standard downloader
+# behind one, and respect an explicit HF_HUB_ENABLE_HF_TRANSFER=0.
+PROXY_VARS = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy")
+# find_spec only checks that hf_xet is installed without loading its native extension
+USING_XET = importlib.util.find_spec("hf_xet") is not None
+if not USING_XET:
+    if any(os.environ.get(var) for var in PROXY_VARS):
+        print("Proxy detected — keeping standard downloader (hf_transfer disabled).")
+    elif os.environ.get("HF_HUB_ENABLE_HF_TRANSFER") != "0":
+        os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "1"
 
-import whisperx
-import torch
+from huggingface_hub import HfApi, constants, snapshot_download, try_to_load_from_cache
+from huggingface_hub.utils import LocalEntryNotFoundError
+import argparse
+import json
 import logging
-import sys
+import shutil
+import tempfile
+import time
+import urllib.error
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Flush output per line so progress shows up promptly when stdout is a pipe
+# (e.g. when launched from a GUI or CI) instead of in large buffered bursts
+try:
+    sys.stdout.reconfigure(line_buffering=True)
+    sys.stderr.reconfigure(line_buffering=True)
+except AttributeError:
+    # Streams replaced by something other than a TextIOWrapper (e.g. pythonw)
+    pass
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# CTranslate2 conversion of large-v2 that whisperx.load_model("large-v2") uses
+WHISPER_REPO_ID = "Systran/faster-whisper-large-v2"
+WHISPER_FILES = ["model.bin", "config.json", "tokenizer.json", "vocabulary.txt"]
+# Same files faster-whisper itself downloads; skips README and other extras
+WHISPER_PATTERNS = ["config.json", "preprocessor_config.json", "model.bin", "tokenizer.json", "vocabulary.*"]
+# PyTorch weight formats of a wav2vec2 repo, in order of preference
+ALIGN_WEIGHTS = ("model.safetensors", "pytorch_model.bin")
+# Files a wav2vec2 alignment repo needs; a tuple matches any one of its names
+ALIGN_FILES = ["config.json", "preprocessor_config.json", "vocab.json", ALIGN_WEIGHTS]
+# Config/tokenizer JSON plus one of ALIGN_WEIGHTS; skips TF/Flax weights and n-gram LMs
+ALIGN_PATTERNS = ["*.json"]
+
+# Transient network errors worth retrying (hf_transfer cannot resume on its own)
+NETWORK_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+MAX_ATTEMPTS = 5
+
+# Sidecar next to the hub cache recording {repo_id: snapshot revision} of completed downloads
+MANIFEST_NAME = "whisperx_gui_manifest.json"
+
+# large-v2 (~3GB) plus alignment models, with headroom for temporary copies
+MIN_FREE_DISK_GB = 8
+
+def get_download_workers():
+    """
+    Return the number of concurrent file downloads per repo.
+    Set WHISPERX_DL_WORKERS to raise it on fast connections; values above 16
+    tend to be throttled on CPU-limited machines. Defaults to 8.
+    """
+    try:
+        return max(1, int(os.environ.get("WHISPERX_DL_WORKERS", "8")))
+    except ValueError:
+        print("⚠️  WHISPERX_DL_WORKERS is not a number; using 8.")
+        return 8
+
+def get_cache_dir():
+    """
+    Return the Hugging Face hub cache directory as resolved by huggingface_hub.
+    """
+    return constants.HF_HUB_CACHE
+
+def is_cached(repo_id, filenames, cache_dir):
+    """
+    Check the local cache for a repo without any network requests.
+    Returns True only if every file (or one name of each tuple) is present.
+    """
+    def cached(filename):
+        # try_to_load_from_cache returns a path only for files that are on disk
+        return isinstance(try_to_load_from_cache(repo_id, filename, cache_dir=cache_dir), str)
+    return all(
+        any(cached(name) for name in entry) if isinstance(entry, tuple) else cached(entry)
+        for entry in filenames
+    )
+
+def torch_bundle_checkpoint(bundle_name):
+    """
+    Return the path torch.hub stores a torchaudio pipeline bundle's checkpoint at.
+    """
+    import torch
+    import torchaudio
+    bundle = torchaudio.pipelines.__dict__[bundle_name]
+    return os.path.join(torch.hub.get_dir(), "checkpoints", os.path.basename(bundle._path))
+
+def load_manifest(path):
+    """
+    Load the download manifest, or an empty one if it is missing or unreadable.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(path, manifest):
+    """
+    Write the download manifest; failing to write it only costs a slower next run.
+    """
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    except OSError as e:
+        logging.warning("Could not write download manifest %s: %s", path, e)
+
+def in_manifest(manifest, repo_id, cache_dir):
+    """
+    Return True if the manifest's recorded snapshot of repo_id is still on disk.
+    """
+    revision = manifest.get(repo_id)
+    if not revision:
+        return False
+    repo_dir = "models--" + repo_id.replace("/", "--")
+    return os.path.isdir(os.path.join(cache_dir, repo_dir, "snapshots", revision))
+
+def existing_parent(path):
+    """
+    Return path or its nearest ancestor that exists (the cache may not exist yet).
+    """
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+def check_disk_space(cache_dir):
+    """
+    Check that the cache volume has room for the downloads.
+    Returns False (after printing why) if less than MIN_FREE_DISK_GB is free.
+    """
+    cache_volume = existing_parent(cache_dir)
+    free_gb = shutil.disk_usage(cache_volume).free / 2**30
+    if free_gb < MIN_FREE_DISK_GB:
+        print(f"❌ Only {free_gb:.1f}GB free on the cache volume; need at least {MIN_FREE_DISK_GB}GB.")
+        print("   Free up space or point HF_HUB_CACHE to a larger drive and try again.")
+        return False
+    # hf_transfer can stage files in the temp directory before moving them into the cache
+    if os.stat(tempfile.gettempdir()).st_dev != os.stat(cache_volume).st_dev:
+        print(f"⚠️  The temp directory ({tempfile.gettempdir()}) is on a different volume than the cache.")
+        print("   Downloads may be copied between drives, which needs free space on both.")
+    return True
+
+def is_retryable(error, local_files_only=False):
+    """
+    Return True if error is a transient network failure worth retrying.
+    """
+    if isinstance(error, NETWORK_ERRORS):
+        return True
+    # huggingface_hub catches connection errors itself and re-raises them as
+    # LocalEntryNotFoundError with the network error as the cause
+    if isinstance(error, LocalEntryNotFoundError):
+        return not local_files_only and isinstance(error.__cause__, NETWORK_ERRORS)
+    # hf_xet reports transfer failures as a plain RuntimeError; hf_transfer
+    # wraps its failures in one that names it
+    if isinstance(error, RuntimeError):
+        return (USING_XET and not local_files_only) or "hf_transfer" in str(error)
+    # torch.hub downloads (torchaudio bundles) use urllib; 4xx responses are permanent
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code >= 500
+    return isinstance(error, urllib.error.URLError)
+
+def with_retries(func, *args, **kwargs):
+    """
+    Call func, retrying transient network errors with exponential backoff.
+    Waits 4s, 8s, 16s, then 30s between attempts and re-raises after MAX_ATTEMPTS.
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == MAX_ATTEMPTS or not is_retryable(e, kwargs.get("local_files_only", False)):
+                raise
+            wait = min(30, 4 * 2 ** (attempt - 1))
+            print(f"    ⚠️  Network error ({e}). Retrying in {wait}s (attempt {attempt + 1}/{MAX_ATTEMPTS})...")
+            time.sleep(wait)
+
+def write_screen(*lines):
+    """
+    Write a block of lines to stdout in a single call and flush once.
+    Much cheaper than one print() per line on the Windows console.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 def check_and_setup_hf_token():
     """
     Check if HF_TOKEN is set, and if not, guide the user through setting it up.
     Returns True if token is set (or user chooses to skip), False if user wants to exit.
     """
-    print("=" * 60)
-    print("Hugging Face Token Setup")
-    print("=" * 60)
+    header = ["=" * 60, "Hugging Face Token Setup", "=" * 60]
     
     # Check if token is already set
     current_token = os.environ.get("HF_TOKEN")
     if current_token:
-        print("✅ HF_TOKEN is already set in your environment.")
-        print(f"   Token preview: {current_token[:10]}...{current_token[-4:] if len(current_token) > 14 else ''}")
-        print()
+        write_screen(
+            *header,
+            "✅ HF_TOKEN is already set in your environment.",
+            f"   Token preview: {current_token[:10]}...{current_token[-4:] if len(current_token) > 14 else ''}",
+            "",
+        )
         return True
     
-    print("⚠️  HF_TOKEN is not set.")
-    print()
-    print("The Hugging Face token is required to download alignment models.")
-    print("Without it, you can still download the Whisper model, but word-level")
-    print("alignment will not be available.")
-    print()
-    print("To get a token:")
-    print("  1. Go to https://huggingface.co/settings/tokens")
-    print("  2. Create a new token with 'read' permissions")
-    print("  3. Copy the token value")
-    print()
-    print("-" * 60)
-    print("What would you like to do?")
-    print("  [1] Set HF_TOKEN now (recommended - persistent)")
-    print("  [2] Skip token setup (download Whisper model only)")
-    print("  [3] Exit and set token manually")
-    print("-" * 60)
+    write_screen(
+        *header,
+        "⚠️  HF_TOKEN is not set.",
+        "",
+        "The Hugging Face token is required to download alignment models.",
+        "Without it, you can still download the Whisper model, but word-level",
+        "alignment will not be available.",
+        "",
+        "To get a token:",
+        "  1. Go to https://huggingface.co/settings/tokens",
+        "  2. Create a new token with 'read' permissions",
+        "  3. Copy the token value",
+        "",
+        "-" * 60,
+        "What would you like to do?",
+        "  [1] Set HF_TOKEN now (recommended - persistent)",
+        "  [2] Skip token setup (download Whisper model only)",
+        "  [3] Exit and set token manually",
+        "-" * 60,
+    )
     
     while True:
         choice = input("Enter your choice (1/2/3): ").strip()
@@ -76,11 +281,27 @@ def check_and_setup_hf_token():
                 winreg.SetValueEx(key, 'HF_TOKEN', 0, winreg.REG_SZ, token)
                 winreg.CloseKey(key)
                 
-                print()
-                print("✅ HF_TOKEN has been set successfully!")
-                print("   The token is now set persistently for your user account.")
-                print("   Note: You may need to restart applications to use the token.")
-                print()
+                # Tell Explorer (and terminals started from it) that the user
+                # environment changed; best effort, the token is already stored
+                try:
+                    import ctypes
+                    HWND_BROADCAST = 0xFFFF
+                    WM_SETTINGCHANGE = 0x001A
+                    SMTO_ABORTIFHUNG = 0x0002
+                    ctypes.windll.user32.SendMessageTimeoutW(
+                        HWND_BROADCAST, WM_SETTINGCHANGE, 0, "Environment",
+                        SMTO_ABORTIFHUNG, 5000, ctypes.byref(ctypes.c_ulong())
+                    )
+                except Exception as e:
+                    logging.warning("Could not broadcast environment change: %s", e)
+                
+                write_screen(
+                    "",
+                    "✅ HF_TOKEN has been set successfully!",
+                    "   The token is now set persistently for your user account.",
+                    "   New terminals will see it; applications that are already open may need a restart.",
+                    "",
+                )
                 return True
             except Exception as e:
                 print(f"❌ Failed to set environment variable: {e}")
@@ -89,87 +310,175 @@ def check_and_setup_hf_token():
                 return True
         
         elif choice == "2":
-            print()
-            print("⚠️  Skipping token setup.")
-            print("   Only the Whisper model will be downloaded.")
-            print("   Alignment models require a valid HF_TOKEN.")
-            print()
+            write_screen(
+                "",
+                "⚠️  Skipping token setup.",
+                "   Only the Whisper model will be downloaded.",
+                "   Alignment models require a valid HF_TOKEN.",
+                "",
+            )
             return True
         
         elif choice == "3":
-            print()
-            print("Exiting. You can set the token manually using:")
-            print("  PowerShell: [System.Environment]::SetEnvironmentVariable('HF_TOKEN', 'your_token', 'User')")
-            print()
+            write_screen(
+                "",
+                "Exiting. You can set the token manually using:",
+                "  PowerShell: [System.Environment]::SetEnvironmentVariable('HF_TOKEN', 'your_token', 'User')",
+                "",
+            )
             return False
         
         else:
             print("❌ Invalid choice. Please enter 1, 2, or 3.")
 
-def download_models():
+def download_models(offline=False):
     """
     Downloads the necessary models for WhisperX to the Hugging Face cache.
+    With offline=True nothing is fetched; the cache is only checked.
     """
-    print("=" * 60)
-    print("WhisperX Model Downloader")
-    print("=" * 60)
-    print("This script will download the models required for WhisperX.")
-    print("Models will be stored in your Hugging Face cache directory.")
-    print("Default location: C:\\Users\\<YourUser>\\.cache\\huggingface\\hub")
-    print()
-    
+    cache_dir = get_cache_dir()
+    workers = get_download_workers()
+    write_screen(
+        "=" * 60,
+        "WhisperX Model Downloader",
+        "=" * 60,
+        "This script will download the models required for WhisperX.",
+        "Models will be stored in your Hugging Face cache directory.",
+        f"Cache directory: {cache_dir}",
+        *(["Offline mode: only checking the local cache."] if offline else []),
+        f"Download workers per model: {workers}",
+        "",
+    )
+
     # Check and setup HF token
     if not check_and_setup_hf_token():
         input("Press Enter to exit...")
         return
     
     print("-" * 60)
-    device = "cuda" if torch.cuda.is_available() else "cpu"
-    compute_type = "float16" if device == "cuda" else "int8"
-    
-    print(f"Using device: {device}")
-    print(f"Compute type: {compute_type}")
-    print("-" * 60)
 
-    # 1. Download Whisper Model
-    print("\n[1/2] Downloading Whisper Model (large-v2)...")
-    print("This may take several minutes depending on your connection...")
-    try:
-        # This triggers the download
-        model = whisperx.load_model("large-v2", device=device, compute_type=compute_type)
-        print("✅ Whisper model downloaded successfully.")
-        del model  # Free memory
-    except Exception as e:
-        print(f"❌ Failed to download Whisper model: {e}")
-        print("\n" + "=" * 60)
-        print("Download process failed.")
-        print("=" * 60)
-        input("Press Enter to exit...")
-        return
-
-    # 2. Download Alignment Models (only if HF_TOKEN is set)
+    # Collect all input up front so the downloads can run as one parallel batch
     has_token = bool(os.environ.get("HF_TOKEN"))
-    
+    languages = []
     if has_token:
-        # Ask which languages to download
-        print("\n[2/2] Downloading Alignment Models...")
-        print("Which languages would you like to download alignment models for?")
-        print("  Common options: en (English), nl (Dutch), fr (French), de (German), es (Spanish)")
-        print("  Enter language codes separated by spaces (e.g., 'en nl fr')")
-        print("  Or press Enter for default: en nl")
+        write_screen(
+            "Which languages would you like to download alignment models for?",
+            "  Common options: en (English), nl (Dutch), fr (French), de (German), es (Spanish)",
+            "  Enter language codes separated by spaces (e.g., 'en nl fr')",
+            "  Or press Enter for default: en nl",
+        )
         
         lang_input = input("\nLanguage codes: ").strip()
-        languages = lang_input.split() if lang_input else ["en", "nl"]
-        
-        print(f"\nDownloading alignment models for: {', '.join(languages)}...")
-        
-        for lang in languages:
-            print(f"  - Downloading alignment model for '{lang}'...")
+        # Normalize case and drop duplicates so no repo is fetched twice
+        languages = list(dict.fromkeys(lang_input.lower().split() or ["en", "nl"]))
+
+    manifest_path = os.path.join(os.path.dirname(cache_dir), MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+    revisions = {}
+
+    def fetch_repo(repo_id, filenames, patterns, weights=()):
+        """
+        Returns True if the repo was already cached.
+        Only the first of weights that the repo actually has is downloaded.
+        """
+        # A recorded snapshot that is still on disk needs no further checks
+        if in_manifest(manifest, repo_id, cache_dir):
+            return True
+        cached = is_cached(repo_id, filenames, cache_dir)
+        if weights and not (offline or cached):
+            repo_files = with_retries(HfApi().list_repo_files, repo_id)
+            weights = [next((name for name in weights if name in repo_files), weights[-1])]
+        patterns = patterns + list(weights)
+        # Only fetch the files; there is no need to build the model or touch the GPU.
+        # For cached repos this just resolves the local snapshot without network access.
+        path = with_retries(
+            snapshot_download,
+            repo_id=repo_id,
+            cache_dir=cache_dir,
+            allow_patterns=patterns,
+            max_workers=workers,
+            local_files_only=offline or cached,
+        )
+        # snapshot_download returns .../snapshots/<revision>
+        revisions[repo_id] = os.path.basename(os.path.normpath(path))
+        return cached
+
+    def download_whisper_model():
+        """Returns True if the model was already cached."""
+        return fetch_repo(WHISPER_REPO_ID, WHISPER_FILES, WHISPER_PATTERNS)
+
+    def is_present(repo_id, filenames):
+        return in_manifest(manifest, repo_id, cache_dir) or is_cached(repo_id, filenames, cache_dir)
+
+    align_repos = {}
+    if languages:
+        # Imported only now, and only when alignment models are wanted, so the token
+        # setup, early exits and Whisper-only runs skip the torch/transformers startup cost
+        import whisperx
+        from whisperx.alignment import DEFAULT_ALIGN_MODELS_HF, DEFAULT_ALIGN_MODELS_TORCH
+
+        unknown = [lang for lang in languages if lang not in DEFAULT_ALIGN_MODELS_HF and lang not in DEFAULT_ALIGN_MODELS_TORCH]
+        if unknown:
+            print(f"⚠️  No alignment model available for: {', '.join(unknown)} — skipping.")
+            languages = [lang for lang in languages if lang not in unknown]
+
+        # Resolve the Hugging Face repo of each language once; None means a torchaudio
+        # bundle, which is left to WhisperX
+        align_repos = {lang: DEFAULT_ALIGN_MODELS_HF.get(lang) for lang in languages}
+
+        def bundle_cached(lang):
+            return os.path.isfile(torch_bundle_checkpoint(DEFAULT_ALIGN_MODELS_TORCH[lang]))
+
+        def download_align_model(lang):
+            """Returns True if the model was already cached."""
+            repo_id = align_repos[lang]
+            if repo_id:
+                return fetch_repo(repo_id, ALIGN_FILES, ALIGN_PATTERNS, ALIGN_WEIGHTS)
+            if bundle_cached(lang):
+                return True
+            if offline:
+                raise FileNotFoundError("torchaudio bundle is not cached (offline mode)")
+            # torchaudio bundles go through WhisperX itself
+            model_a, metadata = with_retries(whisperx.load_align_model, language_code=lang, device="cpu")
+            del model_a, metadata  # Free memory
+            return False
+
+    # Fail fast instead of running out of space halfway through a download,
+    # but only when something actually has to be fetched
+    needs_download = not offline and (not is_present(WHISPER_REPO_ID, WHISPER_FILES) or any(
+        not (is_present(repo_id, ALIGN_FILES) if repo_id else bundle_cached(lang))
+        for lang, repo_id in align_repos.items()
+    ))
+    if needs_download and not check_disk_space(cache_dir):
+        input("Press Enter to exit...")
+        return
+
+    # 1. Whisper Model and 2. Alignment Models (only if HF_TOKEN is set)
+    print("\n[1/2] Downloading Whisper Model (large-v2)...")
+    print("This may take several minutes depending on your connection...")
+    if languages:
+        print(f"[2/2] Downloading Alignment Models for: {', '.join(languages)}...")
+    elif has_token:
+        print("[2/2] Skipping Alignment Models (no supported languages selected)")
+    else:
+        print("[2/2] Skipping Alignment Models (no HF_TOKEN set)")
+        print("To download alignment models later, set HF_TOKEN and run this script again.")
+    print()
+
+    # Every model is a separate repo, so fetch them all concurrently
+    whisper_error = None
+    with ThreadPoolExecutor(max_workers=min(8, 1 + len(languages))) as executor:
+        futures = {executor.submit(download_whisper_model): None}
+        futures.update({executor.submit(download_align_model, lang): lang for lang in languages})
+        for future in as_completed(futures):
+            lang = futures[future]
             try:
-                model_a, metadata = whisperx.load_align_model(language_code=lang, device=device)
-                print(f"    ✅ '{lang}' alignment model downloaded.")
-                del model_a, metadata  # Free memory
+                cached = future.result()
             except Exception as e:
+                if lang is None:
+                    whisper_error = e
+                    print(f"❌ Failed to download Whisper model: {e}")
+                    continue
                 error_msg = str(e).lower()
                 if "401" in error_msg or "unauthorized" in error_msg or "authentication" in error_msg:
                     print(f"    ❌ Authentication failed for '{lang}'.")
@@ -177,35 +486,76 @@ def download_models():
                     print(f"       Please check your token at https://huggingface.co/settings/tokens")
                 else:
                     print(f"    ❌ Failed to download alignment model for '{lang}': {e}")
-    else:
-        print("\n[2/2] Skipping Alignment Models (no HF_TOKEN set)")
-        print("To download alignment models later, set HF_TOKEN and run this script again.")
+                continue
+            if lang is None:
+                print("✅ Whisper model already cached — skipping download." if cached else "✅ Whisper model downloaded successfully.")
+            else:
+                print(f"    ✅ '{lang}' alignment model {'already cached' if cached else 'downloaded'}.")
+
+    if revisions:
+        manifest.update(revisions)
+        save_manifest(manifest_path, manifest)
+
+    if whisper_error is not None:
+        print("\n" + "=" * 60)
+        print("Download process failed.")
+        print("=" * 60)
+        input("Press Enter to exit...")
+        return
 
     # 3. Download NLTK Data (required for alignment)
     print("\n[3/3] Downloading NLTK Data (required for word-level alignment)...")
     try:
         import nltk
-        print("  - Downloading punkt tokenizer...")
-        nltk.download('punkt', quiet=True)
-        print("    ✅ punkt tokenizer downloaded.")
-        
-        print("  - Downloading punkt_tab tokenizer...")
-        nltk.download('punkt_tab', quiet=True)
-        print("    ✅ punkt_tab tokenizer downloaded.")
+        from nltk.downloader import Downloader
+
+        def is_installed(package):
+            # Searches NLTK_DATA and the default data paths
+            try:
+                nltk.data.find(f"tokenizers/{package}")
+                return True
+            except LookupError:
+                return False
+
+        missing = []
+        for package in ("punkt", "punkt_tab"):
+            if is_installed(package):
+                print(f"  - ✅ {package} tokenizer already installed.")
+            elif offline:
+                print(f"  - ⚠️  {package} tokenizer is not installed (offline mode, skipping download).")
+            else:
+                print(f"  - Downloading {package} tokenizer...")
+                missing.append(package)
+
+        # Independent downloads; a Downloader per thread avoids sharing its state
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda package: Downloader().download(package, quiet=True), missing))
+        for package, ok in zip(missing, results):
+            if ok:
+                print(f"    ✅ {package} tokenizer downloaded.")
+            else:
+                print(f"    ⚠️  Failed to download {package} tokenizer.")
     except Exception as e:
         print(f"    ⚠️  Failed to download NLTK data: {e}")
         print("    You may need to download it manually later with:")
         print("    python -c \"import nltk; nltk.download('punkt'); nltk.download('punkt_tab')\"")
 
-    print("\n" + "=" * 60)
-    print("Download process completed!")
-    print("You can now run the WhisperX GUI.")
-    print("=" * 60)
+    write_screen(
+        "",
+        "=" * 60,
+        "Download process completed!",
+        "You can now run the WhisperX GUI.",
+        "=" * 60,
+    )
     input("Press Enter to exit...")
 
 if __name__ == "__main__":
+    # No abbreviations: the HF_HUB_OFFLINE check at the top only matches the full --offline
+    parser = argparse.ArgumentParser(description="Pre-download the models used by the WhisperX GUI.", allow_abbrev=False)
+    parser.add_argument("--offline", action="store_true", help="Only use the local cache; make no network requests.")
+    args = parser.parse_args()
     try:
-        download_models()
+        download_models(offline=args.offline)
     except KeyboardInterrupt:
         print("\n\n⚠️  Download cancelled by user.")
         input("Press Enter to exit...")